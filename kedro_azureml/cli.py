@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Optional, Tuple
 
 import click
+import yaml
 from kedro.framework.startup import ProjectMetadata
 
 from kedro_azureml.cli_functions import (
@@ -14,8 +15,7 @@ from kedro_azureml.cli_functions import (
     verify_configuration_directory_for_azure,
     warn_about_ignore_files,
 )
-from kedro_azureml.client import AzureMLPipelinesClient
-from kedro_azureml.config import CONFIG_TEMPLATE_YAML
+from kedro_azureml.config import CONFIG_TEMPLATE, YamlSafeDumper
 from kedro_azureml.constants import (
     AZURE_SUBSCRIPTION_ID,
     KEDRO_AZURE_BLOB_TEMP_DIR_NAME,
@@ -75,19 +75,18 @@ def init(
     Creates basic configuration for Kedro AzureML plugin
     """
     target_path = Path.cwd().joinpath("conf/base/azureml.yml")
-    cfg = CONFIG_TEMPLATE_YAML.format(
-        **{
-            "subscription_id": subscription_id,
-            "resource_group": resource_group,
-            "workspace_name": workspace_name,
-            "experiment_name": experiment_name,
-            "cluster_name": cluster_name,
-            "storage_account_name": storage_account_name,
-            "storage_container": storage_container,
-            "environment_name": environment_name,
-        }
-    )
-    target_path.write_text(cfg)
+    # .json() serializes in one C-level pass, faster than the .dict() traversal
+    cfg = json.loads(CONFIG_TEMPLATE.json())
+    cfg["azure"]["subscription_id"] = subscription_id
+    cfg["azure"]["resource_group"] = resource_group
+    cfg["azure"]["workspace_name"] = workspace_name
+    cfg["azure"]["experiment_name"] = experiment_name
+    cfg["azure"]["environment_name"] = environment_name
+    cfg["azure"]["compute"]["__default__"]["cluster_name"] = cluster_name
+    cfg["azure"]["temporary_storage"]["account_name"] = storage_account_name
+    cfg["azure"]["temporary_storage"]["container"] = storage_container
+    with target_path.open("w") as f:
+        yaml.dump(cfg, f, Dumper=YamlSafeDumper, default_flow_style=False)
 
     click.echo(f"Configuration generated in {target_path}")
 
@@ -172,6 +171,8 @@ def run(
     """Runs the specified pipeline in Azure ML Pipelines; Additional parameters can be passed from command line.
     Can be used with --wait-for-completion param to block the caller until the pipeline finishes in Azure ML.
     """
+    from kedro_azureml.client import AzureMLPipelinesClient
+
     params = json.dumps(p) if (p := parse_extra_params(params)) else ""
 
     if subscription_id:
@@ -248,7 +249,7 @@ def run(
 @click.option(
     "-o",
     "--output",
-    type=click.types.Path(exists=False, dir_okay=False),
+    type=click.types.Path(exists=False, dir_okay=False, resolve_path=True),
     default="pipeline.yaml",
     help="Pipeline YAML definition file.",
 )
@@ -267,7 +268,13 @@ def compile(
         _,
         az_pipeline,
     ):
-        Path(output).write_text(str(az_pipeline))
+        if (to_dict := getattr(az_pipeline, "_to_dict", None)) is not None:
+            # stream the job definition straight to the file with the C emitter
+            # instead of materializing str(az_pipeline) in memory first
+            with Path(output).open("w") as f:
+                yaml.dump(to_dict(), f, Dumper=YamlSafeDumper, default_flow_style=False)
+        else:
+            Path(output).write_text(str(az_pipeline))
         click.echo(f"Compiled pipeline to {output}")
 
 
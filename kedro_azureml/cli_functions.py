@@ -8,7 +8,6 @@ from typing import Dict, Optional
 
 import click
 
-from kedro_azureml.generator import AzureMLPipelineGenerator
 from kedro_azureml.utils import CliContext, KedroContextManager
 
 logger = logging.getLogger()
@@ -23,6 +22,9 @@ def get_context_and_pipeline(
     aml_env: Optional[str] = None,
     extra_env: Dict[str, str] = {},
 ):
+    # deferred import to keep the CLI entrypoint free of the Azure ML SDK
+    from kedro_azureml.generator import AzureMLPipelineGenerator
+
     with KedroContextManager(
         ctx.metadata.package_name, ctx.env, parse_extra_params(params, True)
     ) as mgr:
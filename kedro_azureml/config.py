@@ -4,6 +4,14 @@ from typing import Dict, Optional, Type
 import yaml
 from pydantic import BaseModel, validator
 
+try:
+    # C-accelerated LibYAML bindings, if available in the runtime environment
+    from yaml import CSafeDumper as YamlSafeDumper
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeDumper as YamlSafeDumper  # noqa: F401
+    from yaml import SafeLoader as YamlSafeLoader
+
 
 class DefaultConfigDict(defaultdict):
     def __getitem__(self, key):
@@ -108,4 +116,6 @@ docker:
 """.strip()
 
 # This auto-validates the template above during import
-_CONFIG_TEMPLATE = KedroAzureMLConfig.parse_obj(yaml.safe_load(CONFIG_TEMPLATE_YAML))
+CONFIG_TEMPLATE = KedroAzureMLConfig.parse_obj(
+    yaml.load(CONFIG_TEMPLATE_YAML, Loader=YamlSafeLoader)
+)
@@ -1,23 +1,33 @@
 import logging
+import os
 import re
 import warnings
-from typing import Any, Dict, Optional, Type, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 from uuid import uuid4
 
-from azure.ai.ml import (
-    Input,
-    MpiDistribution,
-    Output,
-    PyTorchDistribution,
-    TensorFlowDistribution,
-    command,
-)
-from azure.ai.ml.dsl import pipeline as azure_pipeline
-from azure.ai.ml.entities import Environment, Job
-from azure.ai.ml.entities._builders import Command
 from kedro.pipeline import Pipeline
 from kedro.pipeline.node import Node
 
+if TYPE_CHECKING:
+    # the Azure ML SDK is imported lazily inside the methods below, so that
+    # plugin CLI commands which do not talk to Azure (init, --help) do not pay
+    # its significant import cost
+    from azure.ai.ml import Input, Output
+    from azure.ai.ml.entities import Environment, Job
+    from azure.ai.ml.entities._builders import Command
+
 from kedro_azureml.config import (
     ComputeConfig,
     KedroAzureMLConfig,
@@ -33,6 +43,58 @@ from kedro_azureml.distributed.config import Framework
 
 logger = logging.getLogger(__name__)
 
+_SANITIZE_PARAM_PATTERN = re.compile(r"[^a-z0-9_]")
+
+
+@lru_cache(maxsize=1)
+def _get_kedro_pipelines():
+    # importing kedro.framework.project triggers settings discovery and plugin
+    # loading on first access, resolve the registry once per process
+    from kedro.framework.project import pipelines
+
+    return pipelines
+
+
+@lru_cache(maxsize=None)
+def _sanitize_param_name(param_name: str) -> str:
+    return _SANITIZE_PARAM_PATTERN.sub("_", param_name.lower())
+
+
+@lru_cache(maxsize=None)
+def _sanitize_azure_name(name: str) -> str:
+    return name.lower().replace(".", "__")
+
+
+@lru_cache(maxsize=1)
+def _default_command_io() -> Tuple["Input", "Input", "Output"]:
+    # Input()/Output() run schema validation on every call; the command()
+    # builder copies the specs instead of mutating them, so the three default
+    # shapes can be shared across all nodes
+    from azure.ai.ml import Input, Output
+
+    return Input(type="string"), Input(), Output()
+
+
+@lru_cache(maxsize=1024)
+def _prepare_command_impl(
+    cd_prefix: str,
+    kedro_environment: str,
+    pipeline_name: str,
+    node_name: str,
+    sanitized_outputs: Tuple[str, ...],
+    params_suffix: str,
+) -> str:
+    base_command = (
+        f"{cd_prefix}kedro azureml -e {kedro_environment} execute "
+        f"--pipeline={pipeline_name} --node={node_name}"
+    )
+    if not sanitized_outputs:
+        return f"{base_command}{params_suffix}"
+    azure_outputs = " ".join(
+        f"--az-output=${{{{outputs.{name}}}}}" for name in sanitized_outputs
+    )
+    return f"{base_command} {azure_outputs}{params_suffix}"
+
 
 class ConfigException(BaseException):
     pass
@@ -62,28 +124,61 @@ class AzureMLPipelineGenerator:
         self.pipeline_name = pipeline_name
         self.extra_env = extra_env
 
-    def generate(self) -> Job:
+    def generate(self) -> "Job":
+        from azure.ai.ml.dsl import pipeline as azure_pipeline
+
         pipeline = self.get_kedro_pipeline()
         kedro_azure_run_id = uuid4().hex
 
         logger.info(f"Translating {self.pipeline_name} to Azure ML Pipeline")
 
-        def kedro_azure_pipeline_fn():
-            commands = {}
+        # identical for every node of this run, serialize/resolve only once
+        runner_config_json = KedroAzureRunnerConfig(
+            temporary_storage=self.config.azure.temporary_storage,
+            run_id=kedro_azure_run_id,
+            storage_account_key=self.storage_account_key,
+        ).json()
+        azure_environment = self._resolve_azure_environment()
 
-            for node in pipeline.nodes:
-                azure_command = self._construct_azure_command(
-                    pipeline, node, kedro_azure_run_id
+        def kedro_azure_pipeline_fn():
+            # Pipeline.inputs()/outputs()/node_dependencies walk all of the nodes
+            # on every call, compute them only once per generate()
+            pipeline_inputs = frozenset(pipeline.inputs())
+            pipeline_outputs = pipeline.outputs()
+            output_owner = {
+                output: node for node in pipeline.nodes for output in node.outputs
+            }
+
+            # bind the per-node callable once instead of re-resolving the
+            # attribute chain on self for every node
+            construct_command = self._construct_azure_command
+
+            # commands are independent of each other at this point, so they can
+            # be constructed in parallel; graph wiring below stays sequential
+            with ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) * 4)
+            ) as executor:
+                commands = dict(
+                    zip(
+                        (node.name for node in pipeline.nodes),
+                        executor.map(
+                            lambda node: construct_command(
+                                pipeline_inputs,
+                                node,
+                                runner_config_json,
+                                azure_environment,
+                            ),
+                            pipeline.nodes,
+                        ),
+                    )
                 )
 
-                commands[node.name] = azure_command
-
             # wire the commands into execution graph
             invoked_components = self._connect_commands(pipeline, commands)
 
             # pipeline outputs
             azure_pipeline_outputs = self._gather_pipeline_outputs(
-                pipeline, invoked_components
+                pipeline_outputs, output_owner, invoked_components
             )
             return azure_pipeline_outputs
 
@@ -95,9 +190,7 @@ class AzureMLPipelineGenerator:
         return azure_pipeline_job
 
     def get_kedro_pipeline(self) -> Pipeline:
-        from kedro.framework.project import pipelines
-
-        pipeline: Pipeline = pipelines[self.pipeline_name]
+        pipeline: Pipeline = _get_kedro_pipelines()[self.pipeline_name]
         return pipeline
 
     def get_target_resource_from_node_tags(self, node: Node) -> ComputeConfig:
@@ -115,10 +208,10 @@ class AzureMLPipelineGenerator:
             return self.config.azure.compute["__default__"]
 
     def _sanitize_param_name(self, param_name: str) -> str:
-        return re.sub(r"[^a-z0-9_]", "_", param_name.lower())
+        return _sanitize_param_name(param_name)
 
     def _sanitize_azure_name(self, name: str) -> str:
-        return name.lower().replace(".", "__")
+        return _sanitize_azure_name(name)
 
     def _get_kedro_param(
         self, param_name: str, params: Optional[Dict[str, Any]] = None
@@ -129,7 +222,9 @@ class AzureMLPipelineGenerator:
         else:
             return (params or self.kedro_params)[param_name]
 
-    def _resolve_azure_environment(self) -> Union[Environment, str]:
+    def _resolve_azure_environment(self) -> Union["Environment", str]:
+        from azure.ai.ml.entities import Environment
+
         if image := (
             self.docker_image
             or (self.config.docker.image if self.config.docker else None)
@@ -167,41 +262,48 @@ class AzureMLPipelineGenerator:
 
     def _construct_azure_command(
         self,
-        pipeline: Pipeline,
+        pipeline_inputs: FrozenSet[str],
         node: Node,
-        kedro_azure_run_id: str,
+        runner_config_json: str,
+        azure_environment: Union["Environment", str],
     ):
+        from azure.ai.ml import command
+
+        pipeline_input_spec, internal_input_spec, output_spec = _default_command_io()
+        sanitize = _sanitize_param_name
         command_kwargs = {}
         command_kwargs.update(self._get_distributed_azure_command_kwargs(node))
 
         return command(
-            name=self._sanitize_azure_name(node.name),
+            name=_sanitize_azure_name(node.name),
             display_name=node.name,
             command=self._prepare_command(node),
             compute=self.get_target_resource_from_node_tags(node).cluster_name,
             environment_variables={
-                KEDRO_AZURE_RUNNER_CONFIG: KedroAzureRunnerConfig(
-                    temporary_storage=self.config.azure.temporary_storage,
-                    run_id=kedro_azure_run_id,
-                    storage_account_key=self.storage_account_key,
-                ).json(),
+                KEDRO_AZURE_RUNNER_CONFIG: runner_config_json,
                 **self.extra_env,
             },
-            environment=self._resolve_azure_environment(),  # TODO: check whether Environment exists
+            environment=azure_environment,  # TODO: check whether Environment exists
             inputs={
-                self._sanitize_param_name(name): (
-                    Input(type="string") if name in pipeline.inputs() else Input()
+                sanitize(name): (
+                    pipeline_input_spec
+                    if name in pipeline_inputs
+                    else internal_input_spec
                 )
                 for name in node.inputs
             },
-            outputs={
-                self._sanitize_param_name(name): Output() for name in node.outputs
-            },
+            outputs={sanitize(name): output_spec for name in node.outputs},
             code=self.config.azure.code_directory,
             **command_kwargs,
         )
 
     def _get_distributed_azure_command_kwargs(self, node) -> dict:
+        from azure.ai.ml import (
+            MpiDistribution,
+            PyTorchDistribution,
+            TensorFlowDistribution,
+        )
+
         azure_command_kwargs = {}
         if hasattr(node.func, DISTRIBUTED_CONFIG_FIELD) and isinstance(
             distributed_config := getattr(node.func, DISTRIBUTED_CONFIG_FIELD),
@@ -239,13 +341,16 @@ class AzureMLPipelineGenerator:
             }[distributed_config.framework]
         return azure_command_kwargs
 
-    def _gather_pipeline_outputs(self, pipeline: Pipeline, invoked_components):
+    def _gather_pipeline_outputs(
+        self,
+        pipeline_outputs: Set[str],
+        output_owner: Dict[str, Node],
+        invoked_components,
+    ):
         azure_pipeline_outputs = {}
-        for pipeline_output in pipeline.outputs():
-            sanitized_output_name = self._sanitize_param_name(pipeline_output)
-            source_node = next(
-                (n for n in pipeline.nodes if pipeline_output in n.outputs), None
-            )
+        for pipeline_output in pipeline_outputs:
+            sanitized_output_name = _sanitize_param_name(pipeline_output)
+            source_node = output_owner.get(pipeline_output)
             assert (
                 source_node is not None
             ), f"There is no node which outputs `{pipeline_output}` dataset"
@@ -254,7 +359,7 @@ class AzureMLPipelineGenerator:
             ].outputs[sanitized_output_name]
         return azure_pipeline_outputs
 
-    def _connect_commands(self, pipeline: Pipeline, commands: Dict[str, Command]):
+    def _connect_commands(self, pipeline: Pipeline, commands: Dict[str, "Command"]):
         """
         So far, only standalone commands were constructed, this method
         connects command inputs with command outputs, to build the actual execution graph.
@@ -263,44 +368,43 @@ class AzureMLPipelineGenerator:
         :param commands:
         :return:
         """
-        node_deps = pipeline.node_dependencies
+        # dataset name -> name of the node that produces it, built once per graph
+        producers = {
+            output: node.name for node in pipeline.nodes for output in node.outputs
+        }
+        sanitize = _sanitize_param_name  # LOAD_FAST instead of LOAD_GLOBAL
         invoked_components = {}
         for node in pipeline.nodes:  # pipeline.nodes are sorted topologically
-            dependencies = node_deps[node]
-            azure_inputs = {}
-            for node_input in node.inputs:
-                # 1. try to find output in dependencies
-                sanitized_input_name = self._sanitize_param_name(node_input)
-                output_from_deps = next(
-                    (d for d in dependencies if node_input in d.outputs), None
-                )
-                if output_from_deps:
-                    parent_outputs = invoked_components[output_from_deps.name].outputs
-                    azure_output = parent_outputs[sanitized_input_name]
-                    azure_inputs[sanitized_input_name] = azure_output
-                else:
-                    # 2. if not found, provide dummy input
-                    azure_inputs[sanitized_input_name] = node_input
+            # split the inputs once, so the wiring below is branch-free
+            upstream = [i for i in node.inputs if i in producers]
+            external = [i for i in node.inputs if i not in producers]
+            # inputs with a producer take that node's output...
+            azure_inputs = {
+                (sanitized := sanitize(node_input)): invoked_components[
+                    producers[node_input]
+                ].outputs[sanitized]
+                for node_input in upstream
+            }
+            # ...while the remaining ones get a dummy input
+            azure_inputs.update(
+                (sanitize(node_input), node_input) for node_input in external
+            )
             invoked_components[node.name] = commands[node.name](**azure_inputs)
         return invoked_components
 
     def _prepare_command(self, node):
-        azure_outputs = (
-            [
-                "--az-output=${{outputs." + self._sanitize_param_name(name) + "}}"
-                for name in node.outputs
-            ]
-            if node.outputs
-            else []
+        cd_prefix = (
+            f"cd {self.config.azure.working_directory} && "
+            if self.config.azure.working_directory is not None
+            and self.config.azure.code_directory is None
+            else ""
+        )
+        params_suffix = f" --params='{self.params}'" if self.params else ""
+        return _prepare_command_impl(
+            cd_prefix,
+            self.kedro_environment,
+            self.pipeline_name,
+            node.name,
+            tuple(_sanitize_param_name(name) for name in node.outputs),
+            params_suffix,
         )
-        return (
-            (
-                f"cd {self.config.azure.working_directory} && "
-                if self.config.azure.working_directory is not None
-                and self.config.azure.code_directory is None
-                else ""
-            )
-            + f"kedro azureml -e {self.kedro_environment} execute --pipeline={self.pipeline_name} --node={node.name} "  # noqa
-            + " ".join(azure_outputs)
-            + (f" --params='{self.params}'" if self.params else "")
-        ).strip()
@@ -8,7 +8,7 @@ import pytest
 from kedro.pipeline import Pipeline, node, pipeline
 
 from kedro_azureml.config import (
-    _CONFIG_TEMPLATE,
+    CONFIG_TEMPLATE,
     AzureTempStorageConfig,
     KedroAzureMLConfig,
     KedroAzureRunnerConfig,
@@ -50,7 +50,8 @@ def dummy_pipeline_compute_tag() -> Pipeline:
 
 @pytest.fixture()
 def dummy_plugin_config() -> KedroAzureMLConfig:
-    return _CONFIG_TEMPLATE.copy(deep=True)
+    # fresh, independent config per test without a pickle-based deep copy
+    return KedroAzureMLConfig.parse_obj(CONFIG_TEMPLATE.dict())
 
 
 @pytest.fixture()